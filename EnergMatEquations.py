@@ -1,10 +1,168 @@
+import io
 import os
 import json
+import math
+import pickle
+import inspect
+import itertools
+import threading
+import concurrent.futures
 import sympy as sp
-import matplotlib.pyplot as plt
 import tkinter as tk
 from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
+from closed_forms import CLOSED_FORMS
+
+# File holding the solved forms of every equation between launches.
+SOLUTIONS_FILE = "solutions.pkl"
+SOLUTIONS_VERSION = 4
+
+# Equation combobox width in characters, fixed to fit the longest name in equations.json (81 characters).
+EQ_COMBO_WIDTH = 85
+
+# Solved forms with more operations than this are JIT-compiled when numba is available.
+NUMBA_MIN_OPS = 50
+
+# Parse an equation's expression string once and keep the result on the equation (None if SymPy cannot parse it).
+def parse_expression(eq_info):
+    if '_expr_sym' not in eq_info:
+        symbols = {v: sp.Symbol(v) for v in eq_info['variables']}
+        try:
+            eq_info['_expr_sym'] = sp.sympify(eq_info['expr'], locals=symbols)
+        except sp.SympifyError:
+            eq_info['_expr_sym'] = None
+    return eq_info['_expr_sym']
+
+# Precompute, for every target variable, the tuple of variables the user has to enter.
+def prepare_equations(equations):
+    for eq_info in equations.values():
+        variables = eq_info['variables']
+        eq_info['_free_vars'] = {target: tuple(v for v in variables if v != target) for target in variables}
+
+# Pick the root that reproduces a sample point with positive inputs (e.g. the + branch of a square root).
+def pick_root(roots, expr, symbols, variables, target_var):
+    if len(roots) == 1:
+        return roots[0]
+    point = {symbols[v]: 3.0 - 0.25 * i for i, v in enumerate(variables[1:])}
+    point[symbols[variables[0]]] = expr.subs(point)
+    expected = complex(point[symbols[target_var]])
+    for root in roots:
+        try:
+            value = complex(root.evalf(subs=point))
+        except TypeError:
+            continue
+        if abs(value - expected) <= 1e-9 * max(1.0, abs(expected)):
+            return root
+    return roots[0]
+
+# Solve an equation for a target variable, returning the frozen (LaTeX, lambdified source, numba flag, srepr) solved form.
+def solve_equation(eq_info, target_var):
+    expr = parse_expression(eq_info)
+    if expr is None:
+        return None
+    symbols = {v: sp.Symbol(v) for v in eq_info['variables']}
+
+    # Solve for the target variable, keeping floats as floats so fractional powers stay cheap.
+    try:
+        sol = sp.solve(sp.Eq(symbols[eq_info['variables'][0]], expr), symbols[target_var], rational=False)
+    except NotImplementedError:
+        return None
+    if not sol:
+        return None
+    solution = pick_root(sol, expr, symbols, eq_info['variables'], target_var)
+
+    # Compile the solved form into a plain math function of the remaining variables.
+    free_vars = eq_info['_free_vars'][target_var]
+    func = sp.lambdify(tuple(symbols[v] for v in free_vars), solution, modules='math', cse=True)
+    solved_latex = sp.latex(sp.Eq(symbols[target_var], solution))
+    heavy = sp.count_ops(solution) > NUMBA_MIN_OPS
+    return solved_latex, inspect.getsource(func), heavy, sp.srepr(solution)
+
+# Compile a solved form with SymEngine, trying its LLVM backend first. Returns None if SymEngine isn't
+# installed or the form cannot be compiled.
+def symengine_solution(expr_repr, free_vars):
+    try:
+        import symengine
+    except ImportError:
+        return None
+    try:
+        expr = symengine.sympify(sp.sympify(expr_repr))
+    except Exception:
+        return None
+    args = [symengine.Symbol(v) for v in free_vars]
+    for backend in ('llvm', 'lambda'):
+        try:
+            compiled = symengine.Lambdify(args, [expr], real=True, backend=backend)
+        except Exception:
+            continue
+        return lambda *values: float(compiled(values)[0])
+    return None
+
+# Rebuild the numeric function from a frozen solution.
+def thaw_solution(frozen, free_vars):
+    _, source, heavy, expr_repr = frozen
+    func = symengine_solution(expr_repr, free_vars)
+    if func is not None:
+        return func
+
+    namespace = dict(vars(math))
+    exec(source, namespace)
+    func = namespace['_lambdifygenerated']
+
+    # Numba is optional and slow to import, so only load it for the larger solved forms. Compile eagerly
+    # so an expression numba cannot handle falls back to plain Python right away.
+    if heavy:
+        try:
+            import numba
+        except ImportError:
+            return func
+        signature = numba.float64(*[numba.float64] * func.__code__.co_argcount)
+        try:
+            func = numba.njit(signature)(func)
+        except Exception:
+            pass
+    return func
+
+# Build the calculator's (function, free variables, LaTeX) entry, preferring the hand-written closed form.
+def make_entry(eq_name, eq_info, target_var, frozen):
+    free_vars = eq_info['_free_vars'][target_var]
+    solved_latex = frozen[0] if frozen is not None else None
+    func = CLOSED_FORMS.get((eq_name, target_var))
+    if func is None:
+        if frozen is None:
+            return None
+        func = thaw_solution(frozen, free_vars)
+    return func, free_vars, solved_latex
+
+# Identify the equations a solutions file was built for.
+def equations_signature(equations):
+    return {name: (info['expr'], tuple(info['variables'])) for name, info in equations.items()}
+
+# Load the frozen solutions saved by earlier launches, or an empty table if they don't match the equations.
+def load_solutions(equations, path=SOLUTIONS_FILE):
+    signature = equations_signature(equations)
+
+    frozen = None
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            if (isinstance(data, dict) and data.get('version') == SOLUTIONS_VERSION
+                    and data.get('signature') == signature and isinstance(data.get('solutions'), dict)):
+                frozen = data['solutions']
+        except Exception:
+            # A damaged or foreign file is treated like a missing one and rewritten on the next save.
+            frozen = None
+    return frozen if frozen is not None else {}
+
+# Save the frozen solutions so later launches can skip solving.
+def save_solutions(equations, frozen, path=SOLUTIONS_FILE):
+    data = {'version': SOLUTIONS_VERSION, 'signature': equations_signature(equations), 'solutions': frozen}
+    try:
+        with open(path, 'wb') as f:
+            pickle.dump(data, f)
+    except OSError:
+        pass
 
 # TOOLTIP CLASS.
 class ToolTip:
@@ -43,9 +201,10 @@ class ToolTip:
 # MAIN CLASS.
 class EnergeticMaterialsCalculator:
     # GUI initialization.
-    def __init__(self, master, equations):
+    def __init__(self, master, equations, solutions=None):
         self.master = master
         self.equations = equations
+        prepare_equations(self.equations)
         self.bg_color = '#4B5320'
         self.fg_color = '#FFD700'
         self.title_font = ("Courier New", 18, "bold")
@@ -56,13 +215,45 @@ class EnergeticMaterialsCalculator:
         self.eq_choice = None
         self.var_choice = None
         self.input_entries = {}
+        self._parsed = {}
         self.result_text = ""
+        self._frozen = solutions if solutions is not None else {}
+        self._solved_cache = {}
+        self._awaiting_solved = None
+        self._closing = False
+        self._image_cache = {}
+        self._pil_cache = {}
+
+        # Equations are rendered on worker threads into one shared figure, guarded by a lock.
+        # The figure is created on the first render so matplotlib is not imported at startup.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._render_lock = threading.Lock()
+        self._fig = None
+        self._canvas = None
+        self._render_tokens = itertools.count()
 
         self.master.title("GMC - Energetic Materials Calculator")
         self.master.geometry("1500x900")
         self.master.configure(bg=self.bg_color)
 
         self.build_gui()
+        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Render every source equation in the background while the user is still choosing one.
+        threading.Thread(target=self._prewarm_images, daemon=True).start()
+
+        # Solve the pairs missing from solutions.pkl on a single SymPy thread and save them once at the end.
+        # The closed forms already give every number; these solves only supply the solved-form LaTeX.
+        self._solver = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        missing = [(eq_name, target_var)
+                   for eq_name, eq_info in self.equations.items()
+                   for target_var in eq_info['variables']
+                   if (eq_name, target_var) not in self._frozen]
+        for key in missing:
+            future = self._solver.submit(self._solve_pair, key)
+            future.add_done_callback(lambda f, key=key: self._notify_solved(key))
+        if missing:
+            self._solver.submit(self._save_frozen)
 
     def build_gui(self):
         # Software title.
@@ -83,7 +274,7 @@ class EnergeticMaterialsCalculator:
             fg=self.fg_color,
             font=self.entry_font).grid(row=0, column=0, padx=5)
 
-        self.eq_choice = ttk.Combobox(choice_frame, values=list(self.equations.keys()), font=self.entry_font, width=80)
+        self.eq_choice = ttk.Combobox(choice_frame, values=list(self.equations.keys()), font=self.entry_font, width=EQ_COMBO_WIDTH)
         self.eq_choice.grid(row=0, column=1, padx=5)
         self.eq_choice.bind("<<ComboboxSelected>>", self.on_equation_selected)
 
@@ -147,10 +338,20 @@ class EnergeticMaterialsCalculator:
             font=self.button_font)
         self.copy_btn.pack(pady=5)
 
-    # Render equation as LaTeX image using matplotlib.pyplot (plt).
-    def render_equation(self, latex_str, filename):
-        plt.figure(figsize=(6, 1.5))
-        plt.text(0.5,
+    # Render equation as LaTeX image using the shared matplotlib figure, straight into memory.
+    def render_equation(self, latex_str):
+        if self._fig is None:
+            # Import matplotlib lazily; the Agg canvas is used directly, so no GUI backend is loaded.
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+            # 6 x 1.5 in at 100 dpi gives exactly the 600 x 150 px shown in the GUI.
+            self._fig = Figure(figsize=(6, 1.5), dpi=100, facecolor='none')
+            self._canvas = FigureCanvasAgg(self._fig)
+
+        fig = self._fig
+        fig.clear()
+        text = fig.text(0.5,
             0.5,
             f"${latex_str}$",
             fontsize=20,
@@ -158,45 +359,90 @@ class EnergeticMaterialsCalculator:
             va='center',
             fontname='Courier New',
             color=self.fg_color)
-        plt.axis('off')
-        plt.tight_layout(pad=0.5)
-        
-        # Create temp folder if it doesn't exist to store the image.
-        if not os.path.exists('temp'):
-            os.makedirs('temp')
-        filepath = os.path.join('temp', filename)
-        plt.savefig(filepath, dpi=300, transparent=True, bbox_inches='tight')
-        plt.close()
-        return filepath
+
+        # Shrink long equations (mostly solved forms) until they fit inside the image.
+        extent = text.get_window_extent(self._canvas.get_renderer())
+        scale = min(0.95 * fig.bbox.width / extent.width, 0.9 * fig.bbox.height / extent.height)
+        if scale < 1:
+            text.set_fontsize(20 * scale)
+
+        buf = io.BytesIO()
+        self._canvas.print_png(buf)
+        buf.seek(0)
+        return Image.open(buf)
 
     # Callback when an equation is selected from the combobox.
     def on_equation_selected(self, event=None):
         # Get selected equation name.
         eq_name = self.eq_choice.get()
+        self._awaiting_solved = None
         eq_info = self.equations[eq_name]
         self.var_choice['values'] = eq_info['variables']
         self.var_choice.set("")
 
-        img_path = self.render_equation(eq_info['latex'], 'equation.png')
-        img = self.load_image(img_path)
-        self.eq_label.config(image=img)
-        self.eq_label.image = img
+        self.show_equation(self.eq_label, eq_info['latex'])
 
-        self.solved_label.config(image="")  # Clear solved form until calculated.
+        # Clear solved form until calculated, dropping any render still in flight.
+        self.solved_label.render_token = None
+        self.solved_label.config(image="", text="")
         self.source_label.config(text=f"Source: {eq_info.get('source', '')}")
 
         for widget in self.input_frame.winfo_children():
             widget.destroy()
         self.output_label.config(text="")
 
-    # Render and display the equation image.
-    def load_image(self, path):
-        img = Image.open(path)
-        max_width = 600 # Resize to fit GUI.
-        aspect_ratio = img.height / img.width
-        new_height = int(max_width * aspect_ratio)
-        img = img.resize((max_width, new_height), Image.LANCZOS)
-        return ImageTk.PhotoImage(img)
+    # Render the equation for display. Runs on a worker thread, so no Tk calls here.
+    # The result goes into the PIL cache; the check and render share the lock so each equation is rendered once.
+    def _render_to_pil(self, latex_str):
+        with self._render_lock:
+            if latex_str not in self._pil_cache and latex_str not in self._image_cache:
+                self._pil_cache[latex_str] = self.render_equation(latex_str)
+
+    # Pre-render all source equations into the PIL cache. Runs on a background thread, so no Tk calls here.
+    def _prewarm_images(self):
+        for eq_info in self.equations.values():
+            # A LaTeX string mathtext can't render is skipped here; show_equation reports it when selected.
+            try:
+                self._render_to_pil(eq_info['latex'])
+            except Exception:
+                continue
+
+    # Move a finished render from the PIL cache to the PhotoImage cache. Main thread only.
+    # The PhotoImage is stored before the PIL entry is dropped, so the key is never missing from both caches.
+    def _promote_image(self, latex_str):
+        if latex_str not in self._image_cache and latex_str in self._pil_cache:
+            self._image_cache[latex_str] = ImageTk.PhotoImage(self._pil_cache[latex_str])
+        self._pil_cache.pop(latex_str, None)
+
+    # Display an equation on a label, rendering it in the background the first time it is shown.
+    def show_equation(self, label, latex_str):
+        token = next(self._render_tokens)
+        label.render_token = token
+        self._promote_image(latex_str)
+        if latex_str in self._image_cache:
+            self._set_label_image(label, self._image_cache[latex_str])
+            return
+
+        label.config(image="", text="Rendering…", font=self.entry_font, fg=self.fg_color)
+        future = self._executor.submit(self._render_to_pil, latex_str)
+        future.add_done_callback(lambda f: self.master.after(0, self._install_image, label, token, latex_str, f))
+
+    # Wrap a finished render in a PhotoImage on the main thread and show it unless the label has moved on.
+    def _install_image(self, label, token, latex_str, future):
+        try:
+            future.result()
+        except Exception as e:
+            if label.render_token == token:
+                label.config(image="", text=f"Could not render equation: {e}")
+            return
+
+        self._promote_image(latex_str)
+        if label.render_token == token:
+            self._set_label_image(label, self._image_cache[latex_str])
+
+    def _set_label_image(self, label, img):
+        label.config(image=img, text="")
+        label.image = img
 
     # Callback when a target variable is selected.
     def on_variable_selected(self, event=None):
@@ -208,35 +454,97 @@ class EnergeticMaterialsCalculator:
         for widget in self.input_frame.winfo_children():
             widget.destroy()
         self.input_entries.clear()
+        self._parsed.clear()
 
         # Create entry fields for all variables except the one we want to calculate.
-        for var in eq_info['variables']:
-            if var != target_var:
-                var_frame = tk.Frame(self.input_frame, bg=self.bg_color)
-                var_frame.pack(pady=2, fill='x')
-
-                lbl = tk.Label(var_frame,
-                    text=f"{var}:",
-                    bg=self.bg_color,
-                    fg=self.fg_color,
-                    font=self.entry_font,
-                    anchor='e',
-                    width=10)
-                lbl.pack(side=tk.LEFT, padx=5)
-                if 'tooltip' in eq_info and var in eq_info['tooltip']:
-                    ToolTip(lbl, eq_info['tooltip'][var])
-
-                ent = tk.Entry(var_frame, font=self.entry_font, width=15)
-                ent.pack(side=tk.LEFT, padx=5)
-
-                unit_lbl = tk.Label(var_frame,
-                    text=eq_info['units'].get(var, ''),
-                    bg=self.bg_color,
-                    fg=self.fg_color,
-                    font=self.entry_font)
-                unit_lbl.pack(side=tk.LEFT, padx=5)
-
-                self.input_entries[var] = ent
+        for var in eq_info['_free_vars'][target_var]:
+            var_frame = tk.Frame(self.input_frame, bg=self.bg_color)
+            var_frame.pack(pady=2, fill='x')
+
+            lbl = tk.Label(var_frame,
+                text=f"{var}:",
+                bg=self.bg_color,
+                fg=self.fg_color,
+                font=self.entry_font,
+                anchor='e',
+                width=10)
+            lbl.pack(side=tk.LEFT, padx=5)
+            if 'tooltip' in eq_info and var in eq_info['tooltip']:
+                ToolTip(lbl, eq_info['tooltip'][var])
+
+            # Parse the value whenever the field changes (typing, pasting or deleting).
+            value = tk.StringVar()
+            value.trace_add("write", lambda *_, v=var, sv=value: self._update_input(v, sv.get()))
+            ent = tk.Entry(var_frame,
+                textvariable=value,
+                font=self.entry_font,
+                width=15,
+                highlightthickness=2,
+                highlightbackground=self.bg_color,
+                highlightcolor=self.bg_color)
+            ent.pack(side=tk.LEFT, padx=5)
+            ent.value = value  # Keep a reference to the StringVar.
+            self._parsed[var] = None
+
+            unit_lbl = tk.Label(var_frame,
+                text=eq_info['units'].get(var, ''),
+                bg=self.bg_color,
+                fg=self.fg_color,
+                font=self.entry_font)
+            unit_lbl.pack(side=tk.LEFT, padx=5)
+
+            self.input_entries[var] = ent
+
+    # Store the parsed value of an input field (None if empty or invalid) and clear its error border once valid.
+    def _update_input(self, var, raw):
+        raw = raw.strip()
+        try:
+            self._parsed[var] = float(raw) if raw else None
+        except ValueError:
+            self._parsed[var] = None
+        if self._parsed[var] is not None and var in self.input_entries:
+            self._mark_input(var, True)
+
+    # Draw a red border around an input field with a missing or invalid value.
+    def _mark_input(self, var, valid):
+        color = self.bg_color if valid else 'red'
+        self.input_entries[var].config(highlightbackground=color, highlightcolor=color)
+
+    # Solve one (equation, variable) pair. Runs on the solver thread, so no Tk calls here.
+    def _solve_pair(self, key):
+        if self._closing:
+            return
+        eq_name, target_var = key
+        try:
+            self._frozen[key] = solve_equation(self.equations[eq_name], target_var)
+        except Exception:
+            self._frozen[key] = None
+
+    # Save everything solved so far. Runs on the solver thread after the last solve.
+    def _save_frozen(self):
+        if not self._closing:
+            save_solutions(self.equations, dict(self._frozen))
+
+    # Hand a finished solve back to the Tk thread.
+    def _notify_solved(self, key):
+        if not self._closing:
+            self.master.after(0, self._on_solved, key)
+
+    # Once a pair the user calculated has been solved, calculate again to show its solved form.
+    def _on_solved(self, key):
+        if self._awaiting_solved == key and key == (self.eq_choice.get(), self.var_choice.get()):
+            self._awaiting_solved = None
+            self.calculate()
+
+    # Look up the solved form. While SymPy is still solving the pair, only the closed form is available (or None).
+    def get_solution(self, eq_name, target_var):
+        key = (eq_name, target_var)
+        eq_info = self.equations[eq_name]
+        if key not in self._frozen:
+            return make_entry(eq_name, eq_info, target_var, None)
+        if key not in self._solved_cache:
+            self._solved_cache[key] = make_entry(eq_name, eq_info, target_var, self._frozen[key])
+        return self._solved_cache[key]
 
     # Perform calculation based on user inputs.
     def calculate(self):
@@ -244,32 +552,42 @@ class EnergeticMaterialsCalculator:
         eq_info = self.equations[eq_name]
         target_var = self.var_choice.get()
 
-        # Define symbols for sympy to parse.
-        symbols = {v: sp.Symbol(v) for v in eq_info['variables']}
-        expr = sp.sympify(eq_info['expr'], locals=symbols)
-
-        # Solve for the target variable.
-        sol = sp.solve(sp.Eq(symbols[eq_info['variables'][0]], expr), symbols[target_var])
-        if not sol:
-            messagebox.showerror("Error", "Cannot solve for selected variable.")
+        key = (eq_name, target_var)
+        solving = key not in self._frozen
+        self._awaiting_solved = key if solving else None
+        entry = self.get_solution(eq_name, target_var)
+        if entry is None:
+            if solving:
+                # No closed form: the result is shown once the background solve finishes.
+                self.output_label.config(text="Solving…")
+            else:
+                messagebox.showerror("Error", "Cannot solve for selected variable.")
             return
-        solution = sol[0]
-
-        # Collect user inputs and substitute into the solution.
-        subs = {}
-        for var, ent in self.input_entries.items():
-            val = ent.get()
-            try:
-                val = float(val)
-                unit = eq_info['units'].get(var, '')
-                subs[var] = val
-            except:
+        func, free_vars, solved_latex = entry
+
+        # Inputs are parsed as they are typed; flag every field without a valid number.
+        invalid = [var for var in free_vars if self._parsed.get(var) is None]
+        if invalid:
+            for var in invalid:
+                self._mark_input(var, False)
+            var = invalid[0]
+            if not self.input_entries[var].get().strip():
+                messagebox.showerror("Input Error", f"Missing value for {var}")
+            else:
                 messagebox.showerror("Input Error", f"Invalid number for {var}")
-                return
+            return
+
+        # Pass the parsed inputs positionally, in the order the solved function expects them.
+        args = [self._parsed[var] for var in free_vars]
 
         # Evaluate the expression and display the result.
         try:
-            result = solution.evalf(subs=subs)
+            result = func(*args)
+
+            # Fractional powers of negative numbers give complex values instead of raising.
+            if isinstance(result, complex) or not math.isfinite(result):
+                messagebox.showerror("Error", f"No real solution for {target_var} with these inputs.")
+                return
             unit = eq_info['units'].get(target_var, '')
             display_val = result
             
@@ -277,14 +595,21 @@ class EnergeticMaterialsCalculator:
             self.output_label.config(text=self.result_text)
 
             # Render solved form.
-            solved_latex = sp.latex(sp.Eq(symbols[target_var], solution))
-            img_path = self.render_equation(solved_latex, 'solved.png')
-            img = self.load_image(img_path)
-            self.solved_label.config(image=img)
-            self.solved_label.image = img
+            if solved_latex is not None:
+                self.show_equation(self.solved_label, solved_latex)
+            else:
+                self.solved_label.render_token = None
+                self.solved_label.config(image="", text="Solving…" if solving else "", font=self.entry_font, fg=self.fg_color)
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    # Stop background solving and close the window without waiting for the remaining solves.
+    def on_close(self):
+        self._closing = True
+        self._solver.shutdown(wait=False)
+        self._executor.shutdown(wait=False)
+        self.master.destroy()
+
     def copy_to_clipboard(self):
         if self.result_text:
             self.master.clipboard_clear()
@@ -297,8 +622,10 @@ if __name__ == "__main__":
     # Get equations from the JSON file.
     with open("equations.json", "r", encoding="utf-8") as f:
         EQUATIONS = json.load(f)
+    # Reuse solved forms from earlier launches; anything missing is solved on first use.
+    SOLUTIONS = load_solutions(EQUATIONS)
     root = tk.Tk()
-    app = EnergeticMaterialsCalculator(root, EQUATIONS)
+    app = EnergeticMaterialsCalculator(root, EQUATIONS, SOLUTIONS)
     
     # Start the GUI event loop.
     root.mainloop()
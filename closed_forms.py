@@ -0,0 +1,355 @@
+import math
+
+# Hand-written solved forms of the equations in equations.json.
+# Each function takes the remaining variables in the order they are listed in the JSON file.
+
+# FRICTION SENSITIVITY (FS).
+def friction_sensitivity_FS(nH, nN, nO, Mw, Pplus, Pminus):
+    return 600.8 - 2428.6 * (nH / Mw) - 6481.4 * (nN / Mw) - 9560.9 * (nO / Mw) + 54.5 * Pplus - 77.8 * Pminus
+
+def friction_sensitivity_nH(FS, nN, nO, Mw, Pplus, Pminus):
+    return ((600.8 + 54.5 * Pplus - 77.8 * Pminus - FS) * Mw - 6481.4 * nN - 9560.9 * nO) / 2428.6
+
+def friction_sensitivity_nN(FS, nH, nO, Mw, Pplus, Pminus):
+    return ((600.8 + 54.5 * Pplus - 77.8 * Pminus - FS) * Mw - 2428.6 * nH - 9560.9 * nO) / 6481.4
+
+def friction_sensitivity_nO(FS, nH, nN, Mw, Pplus, Pminus):
+    return ((600.8 + 54.5 * Pplus - 77.8 * Pminus - FS) * Mw - 2428.6 * nH - 6481.4 * nN) / 9560.9
+
+def friction_sensitivity_Mw(FS, nH, nN, nO, Pplus, Pminus):
+    return (2428.6 * nH + 6481.4 * nN + 9560.9 * nO) / (600.8 + 54.5 * Pplus - 77.8 * Pminus - FS)
+
+def friction_sensitivity_Pplus(FS, nH, nN, nO, Mw, Pminus):
+    return (FS - 600.8 + (2428.6 * nH + 6481.4 * nN + 9560.9 * nO) / Mw + 77.8 * Pminus) / 54.5
+
+def friction_sensitivity_Pminus(FS, nH, nN, nO, Mw, Pplus):
+    return (600.8 - (2428.6 * nH + 6481.4 * nN + 9560.9 * nO) / Mw + 54.5 * Pplus - FS) / 77.8
+
+# DENSITY (ρ).
+def density_rho(M, V0001, nusigma):
+    return 0.9183 * (M / V0001) + 0.0028 * nusigma + 0.0443
+
+def density_M(rho, V0001, nusigma):
+    return (rho - 0.0028 * nusigma - 0.0443) * V0001 / 0.9183
+
+def density_V0001(rho, M, nusigma):
+    return 0.9183 * M / (rho - 0.0028 * nusigma - 0.0443)
+
+def density_nusigma(rho, M, V0001):
+    return (rho - 0.9183 * (M / V0001) - 0.0443) / 0.0028
+
+# DETONATION PRESSURE - KAMLET-JACOBS (KJ).
+def pressure_kj_P(rho, N, M, Qmax):
+    return 1.558 * rho**2 * N * math.sqrt(M * Qmax)
+
+def pressure_kj_rho(P, N, M, Qmax):
+    return math.sqrt(P / (1.558 * N * math.sqrt(M * Qmax)))
+
+def pressure_kj_N(P, rho, M, Qmax):
+    return P / (1.558 * rho**2 * math.sqrt(M * Qmax))
+
+def pressure_kj_M(P, rho, N, Qmax):
+    return (P / (1.558 * rho**2 * N))**2 / Qmax
+
+def pressure_kj_Qmax(P, rho, N, M):
+    return (P / (1.558 * rho**2 * N))**2 / M
+
+# DETONATION PRESSURE - PEPEKIN-LEBEDEV (PL).
+def pressure_pl_P(neff, Qcal, rho):
+    return 4.0 + 7.5 * rho**2 * neff * math.sqrt(Qcal)
+
+def pressure_pl_neff(P, Qcal, rho):
+    return (P - 4.0) / (7.5 * rho**2 * math.sqrt(Qcal))
+
+def pressure_pl_Qcal(P, neff, rho):
+    return ((P - 4.0) / (7.5 * rho**2 * neff))**2
+
+def pressure_pl_rho(P, neff, Qcal):
+    return math.sqrt((P - 4.0) / (7.5 * neff * math.sqrt(Qcal)))
+
+# DETONATION PRESSURE - SMIRNOV-SMIRNOV (SS).
+def pressure_ss_P(rho, a, b, c, Qmax, Ng):
+    return 0.034 * rho**2.022 * a**(-0.0111) * b**0.00536 * c**0.149 * Qmax**0.589 * Ng**0.26
+
+def pressure_ss_rho(P, a, b, c, Qmax, Ng):
+    return (P / (0.034 * a**(-0.0111) * b**0.00536 * c**0.149 * Qmax**0.589 * Ng**0.26))**(1 / 2.022)
+
+def pressure_ss_a(P, rho, b, c, Qmax, Ng):
+    return (P / (0.034 * rho**2.022 * b**0.00536 * c**0.149 * Qmax**0.589 * Ng**0.26))**(1 / -0.0111)
+
+def pressure_ss_b(P, rho, a, c, Qmax, Ng):
+    return (P / (0.034 * rho**2.022 * a**(-0.0111) * c**0.149 * Qmax**0.589 * Ng**0.26))**(1 / 0.00536)
+
+def pressure_ss_c(P, rho, a, b, Qmax, Ng):
+    return (P / (0.034 * rho**2.022 * a**(-0.0111) * b**0.00536 * Qmax**0.589 * Ng**0.26))**(1 / 0.149)
+
+def pressure_ss_Qmax(P, rho, a, b, c, Ng):
+    return (P / (0.034 * rho**2.022 * a**(-0.0111) * b**0.00536 * c**0.149 * Ng**0.26))**(1 / 0.589)
+
+def pressure_ss_Ng(P, rho, a, b, c, Qmax):
+    return (P / (0.034 * rho**2.022 * a**(-0.0111) * b**0.00536 * c**0.149 * Qmax**0.589))**(1 / 0.26)
+
+# IMPACT SENSITIVITY (h50) - CHNO COMPOUNDS.
+def impact_chno_h50(Veff, V0002, nusigma):
+    return -234.83 * math.copysign(abs(Veff - V0002) ** (1 / 3), Veff - V0002) - 3.197 * nusigma + 962
+
+def impact_chno_Veff(h50, V0002, nusigma):
+    return V0002 + ((962 - 3.197 * nusigma - h50) / 234.83)**3
+
+def impact_chno_V0002(h50, Veff, nusigma):
+    return Veff - ((962 - 3.197 * nusigma - h50) / 234.83)**3
+
+def impact_chno_nusigma(h50, Veff, V0002):
+    return (962 - 234.83 * math.copysign(abs(Veff - V0002) ** (1 / 3), Veff - V0002) - h50) / 3.197
+
+# IMPACT SENSITIVITY (h50) - NITRAMINES.
+def impact_nitramines_h50(sigmaplus2, nu):
+    return -0.0064 * sigmaplus2 + 241.42 * nu - 3.43
+
+def impact_nitramines_sigmaplus2(h50, nu):
+    return (241.42 * nu - 3.43 - h50) / 0.0064
+
+def impact_nitramines_nu(h50, sigmaplus2):
+    return (h50 + 0.0064 * sigmaplus2 + 3.43) / 241.42
+
+# DETONATION VELOCITY - KAMLET-JACOBS (KJ).
+def velocity_kj_D(N, M, Qmax, rho):
+    return 1.01 * (M * Qmax)**0.25 * (1 + 1.3 * rho) * math.sqrt(N)
+
+def velocity_kj_N(D, M, Qmax, rho):
+    return (D / (1.01 * (M * Qmax)**0.25 * (1 + 1.3 * rho)))**2
+
+def velocity_kj_M(D, N, Qmax, rho):
+    return (D / (1.01 * (1 + 1.3 * rho) * math.sqrt(N)))**4 / Qmax
+
+def velocity_kj_Qmax(D, N, M, rho):
+    return (D / (1.01 * (1 + 1.3 * rho) * math.sqrt(N)))**4 / M
+
+def velocity_kj_rho(D, N, M, Qmax):
+    return (D / (1.01 * (M * Qmax)**0.25 * math.sqrt(N)) - 1) / 1.3
+
+# DETONATION VELOCITY - PEPEKIN-LEBEDEV (PL).
+def velocity_pl_D(neff, Qcal, rho):
+    return 4.2 + 2.0 * rho * neff * math.sqrt(Qcal)
+
+def velocity_pl_neff(D, Qcal, rho):
+    return (D - 4.2) / (2.0 * rho * math.sqrt(Qcal))
+
+def velocity_pl_Qcal(D, neff, rho):
+    return ((D - 4.2) / (2.0 * rho * neff))**2
+
+def velocity_pl_rho(D, neff, Qcal):
+    return (D - 4.2) / (2.0 * neff * math.sqrt(Qcal))
+
+# DETONATION VELOCITY - SMIRNOV-SMIRNOV (SS).
+def velocity_ss_D(rho, c, d, Qcal, Ng):
+    return 0.481 * rho**0.607 * c**0.089 * d**0.066 * Qcal**0.221 * Ng**0.19
+
+def velocity_ss_rho(D, c, d, Qcal, Ng):
+    return (D / (0.481 * c**0.089 * d**0.066 * Qcal**0.221 * Ng**0.19))**(1 / 0.607)
+
+def velocity_ss_c(D, rho, d, Qcal, Ng):
+    return (D / (0.481 * rho**0.607 * d**0.066 * Qcal**0.221 * Ng**0.19))**(1 / 0.089)
+
+def velocity_ss_d(D, rho, c, Qcal, Ng):
+    return (D / (0.481 * rho**0.607 * c**0.089 * Qcal**0.221 * Ng**0.19))**(1 / 0.066)
+
+def velocity_ss_Qcal(D, rho, c, d, Ng):
+    return (D / (0.481 * rho**0.607 * c**0.089 * d**0.066 * Ng**0.19))**(1 / 0.221)
+
+def velocity_ss_Ng(D, rho, c, d, Qcal):
+    return (D / (0.481 * rho**0.607 * c**0.089 * d**0.066 * Qcal**0.221))**(1 / 0.19)
+
+# HEAT OF SUBLIMATION (ΔHsub).
+def sublimation_dHsub(A, nusigma):
+    return 0.000267 * A**2 + 1.650087 * math.sqrt(nusigma) + 2.966078
+
+def sublimation_A(dHsub, nusigma):
+    return math.sqrt((dHsub - 1.650087 * math.sqrt(nusigma) - 2.966078) / 0.000267)
+
+def sublimation_nusigma(dHsub, A):
+    return ((dHsub - 0.000267 * A**2 - 2.966078) / 1.650087)**2
+
+# ELECTRIC SPARK SENSITIVITY (EES).
+def spark_sensitivity_EES(Egap, Ecrit, sigma_plus, sigma_ref):
+    return 0.5 * (Egap / Ecrit) + 0.3 * (sigma_plus / sigma_ref)
+
+def spark_sensitivity_Egap(EES, Ecrit, sigma_plus, sigma_ref):
+    return (EES - 0.3 * (sigma_plus / sigma_ref)) * Ecrit / 0.5
+
+def spark_sensitivity_Ecrit(EES, Egap, sigma_plus, sigma_ref):
+    return 0.5 * Egap / (EES - 0.3 * (sigma_plus / sigma_ref))
+
+def spark_sensitivity_sigma_plus(EES, Egap, Ecrit, sigma_ref):
+    return (EES - 0.5 * (Egap / Ecrit)) * sigma_ref / 0.3
+
+def spark_sensitivity_sigma_ref(EES, Egap, Ecrit, sigma_plus):
+    return 0.3 * sigma_plus / (EES - 0.5 * (Egap / Ecrit))
+
+# OXYGEN BALANCE (OB).
+def oxygen_balance_OB(nC, nH, nO, Mw):
+    return 16 * (2 * nC + 0.5 * nH - nO) / Mw * 100
+
+def oxygen_balance_nC(OB, nH, nO, Mw):
+    return (OB * Mw / 1600 - 0.5 * nH + nO) / 2
+
+def oxygen_balance_nH(OB, nC, nO, Mw):
+    return (OB * Mw / 1600 - 2 * nC + nO) / 0.5
+
+def oxygen_balance_nO(OB, nC, nH, Mw):
+    return 2 * nC + 0.5 * nH - OB * Mw / 1600
+
+def oxygen_balance_Mw(OB, nC, nH, nO):
+    return 1600 * (2 * nC + 0.5 * nH - nO) / OB
+
+# GURNEY ENERGY (√2E).
+def gurney_sqrt2E(D, rho):
+    return 0.6 * D * (1 + 0.5 * rho) / (1 + rho)
+
+def gurney_D(sqrt2E, rho):
+    return sqrt2E * (1 + rho) / (0.6 * (1 + 0.5 * rho))
+
+def gurney_rho(sqrt2E, D):
+    return (0.6 * D - sqrt2E) / (sqrt2E - 0.3 * D)
+
+# AUTOIGNITION TEMPERATURE (AIT).
+def autoignition_AIT(nNO2, nCH, Mw):
+    return 120 + 25 * nNO2 - 18 * (nCH / Mw)
+
+def autoignition_nNO2(AIT, nCH, Mw):
+    return (AIT - 120 + 18 * (nCH / Mw)) / 25
+
+def autoignition_nCH(AIT, nNO2, Mw):
+    return (120 + 25 * nNO2 - AIT) * Mw / 18
+
+def autoignition_Mw(AIT, nNO2, nCH):
+    return 18 * nCH / (120 + 25 * nNO2 - AIT)
+
+# EXPLOSIVE PERFORMANCE INDEX (EPI).
+def performance_index_EPI(D, P, h50):
+    return 0.7 * D + 0.3 * P - 0.1 * h50
+
+def performance_index_D(EPI, P, h50):
+    return (EPI - 0.3 * P + 0.1 * h50) / 0.7
+
+def performance_index_P(EPI, D, h50):
+    return (EPI - 0.7 * D + 0.1 * h50) / 0.3
+
+def performance_index_h50(EPI, D, P):
+    return (0.7 * D + 0.3 * P - EPI) / 0.1
+
+# Solved forms grouped by equation name and target variable, as named in equations.json.
+_FORMS_BY_EQUATION = {
+    "Friction Sensitivity (FS)": {
+        "FS": friction_sensitivity_FS,
+        "nH": friction_sensitivity_nH,
+        "nN": friction_sensitivity_nN,
+        "nO": friction_sensitivity_nO,
+        "Mw": friction_sensitivity_Mw,
+        "Pplus": friction_sensitivity_Pplus,
+        "Pminus": friction_sensitivity_Pminus,
+    },
+    "Density (ρ)": {
+        "ρ": density_rho,
+        "M": density_M,
+        "V0001": density_V0001,
+        "νσtot2": density_nusigma,
+    },
+    "Detonation Pressure at Chapman-Jouguet point (CJ) - Kamlet Jacobs (KJ) equation": {
+        "P": pressure_kj_P,
+        "ρ": pressure_kj_rho,
+        "N": pressure_kj_N,
+        "M": pressure_kj_M,
+        "Qmax": pressure_kj_Qmax,
+    },
+    "Detonation Pressure at Chapman-Jouguet point (CJ) - Pepekin-Lebedev (PL) equation": {
+        "P": pressure_pl_P,
+        "neff": pressure_pl_neff,
+        "Qcal": pressure_pl_Qcal,
+        "ρ": pressure_pl_rho,
+    },
+    "Detonation Pressure at Chapman-Jouguet point (CJ) - Smirnov-Smirnov (SS) equation": {
+        "P": pressure_ss_P,
+        "ρ": pressure_ss_rho,
+        "a": pressure_ss_a,
+        "b": pressure_ss_b,
+        "c": pressure_ss_c,
+        "Qmax": pressure_ss_Qmax,
+        "Ng": pressure_ss_Ng,
+    },
+    "Impact sensitivity (h50) - CHNO compounds": {
+        "h50": impact_chno_h50,
+        "Veff": impact_chno_Veff,
+        "V0002": impact_chno_V0002,
+        "νσtot2": impact_chno_nusigma,
+    },
+    "Impact sensitivity (h50) - Nitramines": {
+        "h50": impact_nitramines_h50,
+        "σplus2": impact_nitramines_sigmaplus2,
+        "ν": impact_nitramines_nu,
+    },
+    "Detonation velocity (D) - Kamlet Jacobs (KJ) equation": {
+        "D": velocity_kj_D,
+        "N": velocity_kj_N,
+        "M": velocity_kj_M,
+        "Qmax": velocity_kj_Qmax,
+        "ρ": velocity_kj_rho,
+    },
+    "Detonation velocity (D) - Pepekin-Lebedev (PL) equation": {
+        "D": velocity_pl_D,
+        "neff": velocity_pl_neff,
+        "Qcal": velocity_pl_Qcal,
+        "ρ": velocity_pl_rho,
+    },
+    "Detonation velocity (D) - Smirnov-Smirnov (SS) equation": {
+        "D": velocity_ss_D,
+        "ρ": velocity_ss_rho,
+        "c": velocity_ss_c,
+        "d": velocity_ss_d,
+        "Qcal": velocity_ss_Qcal,
+        "Ng": velocity_ss_Ng,
+    },
+    "Heat of sublimation (∆Hsub)": {
+        "ΔHsub": sublimation_dHsub,
+        "A": sublimation_A,
+        "νσtot2": sublimation_nusigma,
+    },
+    "Electric Spark Sensitivity (EES)": {
+        "EES": spark_sensitivity_EES,
+        "Egap": spark_sensitivity_Egap,
+        "Ecrit": spark_sensitivity_Ecrit,
+        "σ₊": spark_sensitivity_sigma_plus,
+        "σ_ref": spark_sensitivity_sigma_ref,
+    },
+    "Oxygen Balance (OB)": {
+        "OB": oxygen_balance_OB,
+        "nC": oxygen_balance_nC,
+        "nH": oxygen_balance_nH,
+        "nO": oxygen_balance_nO,
+        "Mw": oxygen_balance_Mw,
+    },
+    "Gurney Energy (√2E)": {
+        "√2E": gurney_sqrt2E,
+        "D": gurney_D,
+        "ρ": gurney_rho,
+    },
+    "Autoignition Temperature (AIT)": {
+        "AIT": autoignition_AIT,
+        "nNO2": autoignition_nNO2,
+        "nCH": autoignition_nCH,
+        "Mw": autoignition_Mw,
+    },
+    "Explosive Performance Index (EPI)": {
+        "EPI": performance_index_EPI,
+        "D": performance_index_D,
+        "P": performance_index_P,
+        "h50": performance_index_h50,
+    },
+}
+
+# Lookup table keyed by (equation name, target variable).
+CLOSED_FORMS = {
+    (eq_name, target_var): func
+    for eq_name, forms in _FORMS_BY_EQUATION.items()
+    for target_var, func in forms.items()
+}
@@ -0,0 +1,34 @@
+import os
+import json
+import math
+import pytest
+import sympy as sp
+from closed_forms import CLOSED_FORMS
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "equations.json"), "r", encoding="utf-8") as f:
+    EQUATIONS = json.load(f)
+
+# Every (equation, variable) pair in the JSON file needs a closed form.
+def test_every_variable_has_a_closed_form():
+    expected = {(eq_name, var) for eq_name, eq_info in EQUATIONS.items() for var in eq_info['variables']}
+    assert set(CLOSED_FORMS) == expected
+
+# Evaluate the equation at a sample point, then check every inverse recovers its input.
+@pytest.mark.parametrize("eq_name", list(EQUATIONS))
+def test_inverses_round_trip(eq_name):
+    variables = EQUATIONS[eq_name]['variables']
+    values = {v: 3.0 - 0.25 * i for i, v in enumerate(variables[1:])}
+    values[variables[0]] = CLOSED_FORMS[(eq_name, variables[0])](*[values[v] for v in variables[1:]])
+
+    # The forward closed form must agree with the expression in the JSON file. SymPy can't parse the
+    # subscript in σ₊ (Electric Spark Sensitivity), so rename it before parsing.
+    expr = EQUATIONS[eq_name]['expr'].replace('σ₊', 'σplus')
+    symbols = {v: sp.Symbol(v.replace('σ₊', 'σplus')) for v in variables}
+    expected = sp.sympify(expr, locals={s.name: s for s in symbols.values()})
+    expected = float(expected.evalf(subs={symbols[v]: values[v] for v in variables[1:]}))
+    assert math.isclose(values[variables[0]], expected, rel_tol=1e-9), variables[0]
+
+    for target_var in variables[1:]:
+        args = [values[v] for v in variables if v != target_var]
+        result = CLOSED_FORMS[(eq_name, target_var)](*args)
+        assert math.isclose(result, values[target_var], rel_tol=1e-9), target_var
@@ -0,0 +1,46 @@
+import os
+import json
+import copy
+import pickle
+import sympy as sp
+from EnergMatEquations import SOLUTIONS_VERSION, pick_root, load_solutions, save_solutions
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "equations.json"), "r", encoding="utf-8") as f:
+    EQUATIONS = json.load(f)
+
+KJ_PRESSURE = "Detonation Pressure at Chapman-Jouguet point (CJ) - Kamlet Jacobs (KJ) equation"
+
+# Saved solutions load back unchanged.
+def test_solutions_round_trip(tmp_path):
+    path = str(tmp_path / "solutions.pkl")
+    frozen = {(KJ_PRESSURE, "ρ"): ("latex", "source", False, "repr")}
+    save_solutions(EQUATIONS, frozen, path)
+    assert load_solutions(EQUATIONS, path) == frozen
+
+# A damaged file or a pickle that isn't a dict loads as an empty table.
+def test_bad_solutions_file_loads_empty(tmp_path):
+    garbage = tmp_path / "garbage.pkl"
+    garbage.write_bytes(b"not a pickle")
+    assert load_solutions(EQUATIONS, str(garbage)) == {}
+
+    not_dict = tmp_path / "list.pkl"
+    not_dict.write_bytes(pickle.dumps([SOLUTIONS_VERSION, {}]))
+    assert load_solutions(EQUATIONS, str(not_dict)) == {}
+
+# Editing an equation's expression invalidates the saved solutions.
+def test_changed_expression_invalidates_solutions(tmp_path):
+    path = str(tmp_path / "solutions.pkl")
+    save_solutions(EQUATIONS, {(KJ_PRESSURE, "ρ"): ("latex", "source", False, "repr")}, path)
+    edited = copy.deepcopy(EQUATIONS)
+    edited[KJ_PRESSURE]['expr'] = "1.5 * ρ**2 * N * sqrt(M*Qmax)"
+    assert load_solutions(edited, path) == {}
+
+# Solving the Kamlet-Jacobs pressure for density keeps the positive square root.
+def test_pick_root_keeps_positive_density():
+    eq_info = EQUATIONS[KJ_PRESSURE]
+    symbols = {v: sp.Symbol(v) for v in eq_info['variables']}
+    expr = sp.sympify(eq_info['expr'], locals=symbols)
+    roots = sp.solve(sp.Eq(symbols['P'], expr), symbols['ρ'], rational=False)
+    assert len(roots) == 2
+    root = pick_root(roots, expr, symbols, eq_info['variables'], 'ρ')
+    assert float(root.evalf(subs={symbols['P']: 30.0, symbols['N']: 0.03, symbols['M']: 27.0, symbols['Qmax']: 1500.0})) > 0